@@ -11,19 +11,76 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
+import shutil
 import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional: much faster JSON encoding (pip install archiveallthethings[fast])
+except ImportError:
+    orjson = None
 
 API_BASE = "https://api.thingiverse.com"
-DEFAULT_THROTTLE_SECONDS = 5.0
+DEFAULT_THROTTLE_SECONDS = 1.0
+DEFAULT_DOWNLOAD_WORKERS = 5  # Concurrent file/image downloads per Thing
+DEFAULT_THING_WORKERS = 4  # Things downloaded in parallel with --user
+DEFAULT_PAGE_WORKERS = 5  # Concurrent page requests when listing a user's Things
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+MULTIPART_THRESHOLD = 16 << 20  # Files larger than this are fetched in parallel ranges
+MULTIPART_PARTS = 8
+# Range requests in flight across all large files, however many are downloading
+_range_slots = threading.BoundedSemaphore(MULTIPART_PARTS)
 ENV_TOKEN_NAME = "THINGIVERSE_TOKEN"
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "archiveallthethings"
+CACHE_EXPIRE_SECONDS = 30 * 24 * 60 * 60  # Drop cached responses not used for 30 days
+
+# Connection pooling and retry policy for the shared HTTP session. Enough
+# hosts are pooled for the API plus the CDN hosts serving files and images.
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 32  # Kept-alive connections per host, raised to fit --workers
+MAX_RETRIES = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Adaptive API rate limiting, driven by X-RateLimit-* and Retry-After headers
+RATE_LIMIT_MIN_REMAINING = 5  # Pause until the reset once fewer calls remain
+RATE_LIMIT_DEFAULT_WAIT = 30.0  # Pause after a 429 that doesn't say how long
+RATE_LIMIT_MAX_WAIT = 600.0
+_rate_limit_lock = threading.RLock()
+_rate_limit_resume_at = 0.0
+_rate_limit_recovering = False  # Set by a pause, cleared by the next successful request
+
+# Set on Ctrl-C so worker threads stop at their next check instead of
+# running their downloads to completion
+_stop_event = threading.Event()
+
+# Directory/image names drop punctuation and use underscores for spaces;
+# file names only have characters that are invalid on disk replaced
+_DIR_TRANS = str.maketrans({' ': '_', **{c: None for c in '<>:"/\\|?*,;!@#$%^&()+=[]{}\'`~'}})
+_FILE_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# HTML cleanup for descriptions, instructions and comments: line breaks and
+# paragraph tags become newlines, any other tag is removed. A tag can't
+# contain '<', so a literal '<' in the text never swallows a later tag.
+_RE_HTML = re.compile(r'(<br\s*/?>|</?p>)|<[^<>]+>')
 
 
 def get_auth_token(token_arg=None):
@@ -48,16 +105,15 @@ def get_auth_token(token_arg=None):
     )
 
 
+@lru_cache(maxsize=4096)
 def sanitize_filename(name, for_directory=False, for_image=False):
-    """Convert a name to a safe directory/file name."""
+    """Convert a name to a safe directory/file name (cached, as names repeat)."""
     if for_directory or for_image:
-        # Strip punctuation and special characters
-        name = re.sub(r'[<>:"/\\|?*,;!@#$%^&()+=\[\]{}\'`~]', '', name)
-        # Replace spaces with underscores and lowercase
-        name = name.replace(' ', '_').lower()
+        # Strip punctuation, replace spaces with underscores and lowercase
+        name = name.translate(_DIR_TRANS).lower()
     else:
-        # Remove or replace invalid characters
-        name = re.sub(r'[<>:"/\\|?*]', '_', name)
+        # Replace invalid characters
+        name = name.translate(_FILE_TRANS)
     # Remove leading/trailing spaces and dots
     name = name.strip(' .')
     # Limit length
@@ -66,206 +122,688 @@ def sanitize_filename(name, for_directory=False, for_image=False):
     return name
 
 
-def api_get(endpoint, token, params=None):
-    """Make a GET request to the Thingiverse API."""
-    url = f"{API_BASE}{endpoint}"
-    headers = {
-        "Authorization": f"Bearer {token}"
+def html_to_text(html):
+    """Convert Thingiverse HTML to plain markdown-ish text in a single pass."""
+    return _RE_HTML.sub(lambda m: '\n' if m.group(1) else '', html)
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that revalidates GET responses against an on-disk cache.
+
+    Responses carrying an ETag or Last-Modified header are stored as JSON
+    files in cache_dir, keyed by URL. Later requests for the same URL send
+    If-None-Match / If-Modified-Since, and a 304 Not Modified reply is
+    answered with the stored body. Requests that already carry their own
+    validators, and streamed responses, are passed through untouched.
+
+    Entries that haven't been stored or revalidated for expire_after
+    seconds are ignored, and are deleted when the adapter is created.
+    """
+
+    def __init__(self, cache_dir, expire_after=CACHE_EXPIRE_SECONDS, **kwargs):
+        self.cache_dir = Path(cache_dir)
+        self.expire_after = expire_after
+        super().__init__(**kwargs)
+        self._prune()
+
+    def _prune(self):
+        """Delete expired entries (and leftover temporary files)."""
+        cutoff = time.time() - self.expire_after
+        for entry in scan_dir(self.cache_dir).values():
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+    def _cache_path(self, url):
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def _load(self, cache_path):
+        try:
+            if time.time() - os.path.getmtime(cache_path) > self.expire_after:
+                return None
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return None
+
+    def _store(self, cache_path, entry):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so concurrent readers never
+            # see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, cache_path)
+        except IOError:
+            pass
+
+    def send(self, request, stream=False, **kwargs):
+        if (request.method != "GET" or stream
+                or "If-None-Match" in request.headers
+                or "If-Modified-Since" in request.headers):
+            return super().send(request, stream=stream, **kwargs)
+
+        cache_path = self._cache_path(request.url)
+        cached = self._load(cache_path)
+        if cached:
+            if cached.get("etag"):
+                request.headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                request.headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if cached and response.status_code == 304:
+            _ = response.content  # Drain the empty body so the connection is reused
+            response.status_code = 200
+            response.reason = "OK"
+            response._content = cached["body"].encode("utf-8")
+            response.encoding = "utf-8"
+            # Still valid, so restart the expiry clock
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return response
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == 200 and (etag or last_modified):
+            try:
+                body = response.content.decode("utf-8")
+            except UnicodeDecodeError:
+                return response
+            self._store(cache_path, {
+                "url": request.url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": body,
+            })
+
+        return response
+
+
+def create_session(token, cache_dir=None, pool_maxsize=POOL_MAXSIZE):
+    """
+    Create an HTTP session shared by all requests in a run.
+
+    Keeps connections to the API and CDN hosts alive between requests and
+    retries transient failures (including rate limiting) with backoff.
+    pool_maxsize should cover the number of concurrent requests to one
+    host; connections beyond it are closed after use instead of reused.
+    If cache_dir is given, API responses are cached there across runs.
+    """
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        respect_retry_after_header=True,
+        raise_on_status=False,  # Let raise_for_status() report the final error
+    )
+    # API rate limiting (429) is handled by rate_limited_request so that all
+    # threads back off together; it sends every request to the API host,
+    # including file downloads that redirect to a CDN
+    api_retry = retry.new(status_forcelist=[code for code in RETRY_STATUS_CODES if code != 429])
+    adapter_options = {
+        "pool_connections": POOL_CONNECTIONS,
+        "pool_maxsize": pool_maxsize,
     }
 
-    response = requests.get(url, headers=headers, params=params)
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=retry, **adapter_options))
+    if cache_dir:
+        api_adapter = CachingHTTPAdapter(cache_dir, max_retries=api_retry, **adapter_options)
+    else:
+        api_adapter = HTTPAdapter(max_retries=api_retry, **adapter_options)
+    session.mount(API_BASE, api_adapter)
+    session.headers["Authorization"] = f"Bearer {token}"
+    return session
+
+
+def seconds_until(value):
+    """
+    Convert a Retry-After or X-RateLimit-Reset header value to a delay.
+
+    Accepts a number of seconds, a Unix timestamp or an HTTP date. Returns
+    0 if the value can't be parsed.
+    """
+    if not value:
+        return 0.0
+    try:
+        seconds = float(value)
+        if seconds > 1e9:  # Unix timestamp rather than a delay
+            seconds -= time.time()
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return 0.0
+    return min(max(seconds, 0.0), RATE_LIMIT_MAX_WAIT)
+
+
+def update_rate_limit(response):
+    """
+    Schedule a pause for all API requests if the response asks for one.
+
+    Any other response ends the recovery from an earlier pause.
+    """
+    global _rate_limit_resume_at, _rate_limit_recovering
+
+    headers = response.headers
+    delay = 0.0
+
+    if response.status_code == 429:
+        delay = seconds_until(headers.get("Retry-After")) or RATE_LIMIT_DEFAULT_WAIT
+
+    try:
+        remaining = int(headers.get("X-RateLimit-Remaining", RATE_LIMIT_MIN_REMAINING))
+    except ValueError:
+        remaining = RATE_LIMIT_MIN_REMAINING
+    if remaining < RATE_LIMIT_MIN_REMAINING:
+        delay = max(delay, seconds_until(headers.get("X-RateLimit-Reset")))
+
+    with _rate_limit_lock:
+        if delay > 0:
+            _rate_limit_resume_at = max(_rate_limit_resume_at, time.time() + delay)
+            _rate_limit_recovering = True
+        elif response.status_code != 429:
+            _rate_limit_recovering = False
+
+
+@contextmanager
+def rate_limit_slot():
+    """
+    Wait out any scheduled rate limit pause around one API request.
+
+    While recovering from a pause, the lock stays held for the whole
+    request, so requests go out one at a time: the other threads wait
+    until a request succeeds and only then resume in parallel. Ctrl-C ends
+    the pause at once.
+    """
+    with _rate_limit_lock:
+        delay = _rate_limit_resume_at - time.time()
+        if delay > 0:
+            print(f"  Rate limited, waiting {delay:.0f}s...")
+            _stop_event.wait(delay)
+            check_stopped()
+        if _rate_limit_recovering:
+            yield
+            return
+    yield
+
+
+def rate_limited_request(session, method, url, **kwargs):
+    """
+    Send a request, under the shared rate limit if it goes to the API.
+
+    The API adapter doesn't retry 429 responses itself, so requests to the
+    API host are retried here after the pause they schedule. Requests to
+    other hosts are sent as they are.
+    """
+    if not url.startswith(API_BASE):
+        return session.request(method, url, **kwargs)
+
+    response = None
+    for _attempt in range(MAX_RETRIES + 1):
+        if response is not None:
+            response.close()  # A 429 being retried
+        with rate_limit_slot():
+            response = session.request(method, url, **kwargs)
+            update_rate_limit(response)
+        if response.status_code != 429:
+            break
+
+    return response
+
+
+def api_request(endpoint, session, params=None, headers=None):
+    """Make a GET request to the Thingiverse API and return the response."""
+    url = f"{API_BASE}{endpoint}"
+    response = rate_limited_request(session, "GET", url, params=params, headers=headers)
     response.raise_for_status()
-    return response.json()
+    return response
+
+
+def api_get(endpoint, session, params=None):
+    """Make a GET request to the Thingiverse API."""
+    return api_request(endpoint, session, params).json()
+
+
+def check_stopped():
+    """Raise KeyboardInterrupt in a worker thread once the user has pressed Ctrl-C."""
+    if _stop_event.is_set():
+        raise KeyboardInterrupt
+
+
+def copy_stream(source, f):
+    """Copy a file object in DOWNLOAD_CHUNK_SIZE blocks, stopping on Ctrl-C."""
+    while True:
+        check_stopped()
+        chunk = source.read(DOWNLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        f.write(chunk)
+
+
+def download_range(url, part_path, session, headers, start, end):
+    """Download bytes start..end (inclusive) of a URL to part_path."""
+    range_headers = dict(headers, Range=f"bytes={start}-{end}")
+    range_headers["Accept-Encoding"] = "identity"
+
+    with _range_slots:
+        response = rate_limited_request(session, "GET", url, headers=range_headers, stream=True)
+        with response:
+            response.raise_for_status()
+            content_range = response.headers.get("Content-Range", "")
+            if response.status_code != 206 or not content_range.startswith(f"bytes {start}-{end}/"):
+                raise IOError(f"Server did not return bytes {start}-{end}")
+            with open(part_path, 'wb') as f:
+                copy_stream(response.raw, f)
+
+    if os.path.getsize(part_path) != end - start + 1:
+        raise IOError(f"Incomplete download of bytes {start}-{end}")
 
 
-def download_file(url, dest_path, token=None):
-    """Download a file from a URL to the destination path."""
+def download_file_parts(url, part_path, session, headers, size, parts=MULTIPART_PARTS):
+    """
+    Download a large file as several byte ranges over parallel connections.
+
+    At most MULTIPART_PARTS ranges are in flight at once across all files,
+    so several large files downloading together don't multiply the number
+    of connections. The ranges are saved to temporary files next to
+    part_path and joined into it once all of them are complete. Returns
+    False, leaving no range files behind, if the server doesn't support
+    ranges or a range fails, so the caller can fall back to a single stream.
+    """
+    head = rate_limited_request(session, "HEAD", url, headers=headers, allow_redirects=True)
+    head.close()
+    try:
+        content_length = int(head.headers.get("Content-Length", -1))
+    except ValueError:
+        content_length = -1
+    if (head.status_code != 200 or content_length != size
+            or head.headers.get("Accept-Ranges") != "bytes"):
+        return False
+
+    # Fetch the ranges from the final location rather than redirecting each
+    # one through the API, and don't send the API token to another host
+    range_url = head.url
+    range_headers = dict(headers)
+    if urlparse(range_url).netloc != urlparse(url).netloc:
+        range_headers["Authorization"] = None
+
+    step = -(-size // parts)  # Ceiling division
+    ranges = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+    range_paths = [f"{part_path}{i}" for i in range(len(ranges))]
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [
+                executor.submit(download_range, range_url, range_path, session, range_headers,
+                                start, end)
+                for range_path, (start, end) in zip(range_paths, ranges)
+            ]
+            for future in futures:
+                future.result()
+
+        with open(part_path, 'wb') as f:
+            for range_path in range_paths:
+                with open(range_path, 'rb') as part:
+                    shutil.copyfileobj(part, f, length=DOWNLOAD_CHUNK_SIZE)
+    except (IOError, requests.exceptions.RequestException):
+        return False
+    finally:
+        for range_path in range_paths:
+            try:
+                os.remove(range_path)
+            except OSError:
+                pass
+
+    return True
+
+
+def download_file(url, dest_path, session, authenticated=False, resume=False, size=None):
+    """
+    Download a file from a URL to the destination path.
+
+    Data is written to a .part file next to dest_path, which is renamed
+    into place once complete, so dest_path is never left half-written.
+    With resume, a .part file left by an interrupted download is completed
+    by requesting only the missing bytes with a Range header. If the
+    server doesn't honour the range, or the result doesn't match the
+    expected size, the file is downloaded again from the start.
+
+    Fresh downloads whose expected size is above MULTIPART_THRESHOLD are
+    split into parallel range requests when the server supports them.
+    """
+    check_stopped()
+    part_path = f"{dest_path}.part"
     headers = {}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
+    if not authenticated:
+        # Don't send the API token to third-party hosts
+        headers["Authorization"] = None
 
-    response = requests.get(url, headers=headers, stream=True)
-    response.raise_for_status()
+    offset = 0
+    if resume:
+        try:
+            offset = os.path.getsize(part_path)
+        except OSError:
+            offset = 0
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+        # Ranges must refer to the stored bytes, not a compressed encoding
+        headers["Accept-Encoding"] = "identity"
+
+    if not offset and size and size > MULTIPART_THRESHOLD \
+            and download_file_parts(url, part_path, session, headers, size):
+        os.replace(part_path, dest_path)
+        return dest_path
+
+    response = rate_limited_request(session, "GET", url, headers=headers, stream=True)
+    with response:
+        if offset and response.status_code == 416:
+            # Nothing past our offset: complete if the sizes agree
+            if response.headers.get("Content-Range") != f"bytes */{offset}":
+                return download_file(url, dest_path, session, authenticated, size=size)
+        else:
+            response.raise_for_status()
 
-    with open(dest_path, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            f.write(chunk)
+            mode = 'wb'
+            if offset and response.status_code == 206:
+                if not response.headers.get("Content-Range", "").startswith(f"bytes {offset}-"):
+                    return download_file(url, dest_path, session, authenticated, size=size)
+                mode = 'ab'
 
+            # Copy straight from the raw stream in large blocks, decoding any
+            # Content-Encoding on the fly
+            response.raw.decode_content = True
+            with open(part_path, mode) as f:
+                copy_stream(response.raw, f)
+
+    # A resumed file that came out the wrong size was stale; start over
+    if offset and size and os.path.getsize(part_path) != size:
+        return download_file(url, dest_path, session, authenticated, size=size)
+
+    os.replace(part_path, dest_path)
     return dest_path
 
 
-def get_thing(thing_id, token):
+def get_thing(thing_id, session):
     """Get Thing details from the API."""
-    return api_get(f"/things/{thing_id}", token)
+    return api_get(f"/things/{thing_id}", session)
+
+
+def get_thing_if_modified(thing_id, session, validators=None):
+    """
+    Get Thing details unless they are unchanged since a previous download.
+
+    validators is a dict saved by save_validators(). Its ETag and
+    Last-Modified values (or the Thing's own modified time) are sent as
+    If-None-Match / If-Modified-Since. Returns (thing, new_validators);
+    thing is None if the API answered 304 Not Modified.
+    """
+    headers = {}
+    if validators:
+        if validators.get('etag'):
+            headers["If-None-Match"] = validators['etag']
+        last_modified = validators.get('last_modified') or http_date(validators.get('modified'))
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    response = api_request(f"/things/{thing_id}", session, headers=headers or None)
+    if response.status_code == 304:
+        return None, validators
+
+    thing = response.json()
+    return thing, {
+        "id": thing.get('id', thing_id),
+        "modified": thing.get('modified'),
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
 
 
-def get_thing_files(thing_id, token):
+def get_thing_files(thing_id, session):
     """Get all files for a Thing."""
-    return api_get(f"/things/{thing_id}/files", token)
+    return api_get(f"/things/{thing_id}/files", session)
 
 
-def get_thing_images(thing_id, token):
+def get_thing_images(thing_id, session):
     """Get all images for a Thing."""
-    return api_get(f"/things/{thing_id}/images", token)
+    return api_get(f"/things/{thing_id}/images", session)
 
 
-def get_thing_derivatives(thing_id, token):
+def get_thing_derivatives(thing_id, session):
     """Get remixes/derivatives of a Thing."""
-    return api_get(f"/things/{thing_id}/derivatives", token)
+    return api_get(f"/things/{thing_id}/derivatives", session)
 
 
-def get_thing_makes(thing_id, token):
+def get_thing_makes(thing_id, session):
     """Get makes (prints) of a Thing."""
-    return api_get(f"/things/{thing_id}/copies", token)
+    return api_get(f"/things/{thing_id}/copies", session)
 
 
-def get_thing_comments(thing_id, token):
+def get_thing_comments(thing_id, session):
     """Get comments for a Thing."""
-    return api_get(f"/things/{thing_id}/comments", token)
+    return api_get(f"/things/{thing_id}/comments", session)
 
 
-def get_user_things(username, token):
-    """Get all published things by a user."""
-    things = []
-    page = 1
-    per_page = 30
+def fetch_thing_details(thing_id, session):
+    """
+    Fetch the files, images, remixes, makes and comments lists for a Thing.
 
-    while True:
-        params = {"page": page, "per_page": per_page}
-        result = api_get(f"/users/{username}/things", token, params)
+    The requests are independent of each other, so they are issued
+    concurrently. A list that fails to fetch is reported and left empty.
+    """
+    fetchers = [
+        ('files', 'files', get_thing_files),
+        ('images', 'images', get_thing_images),
+        ('derivatives', 'remixes', get_thing_derivatives),
+        ('makes', 'makes', get_thing_makes),
+        ('comments', 'comments', get_thing_comments),
+    ]
+
+    print("Fetching files, images, remixes, makes and comments...")
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        futures = [
+            (key, label, executor.submit(fetch, thing_id, session))
+            for key, label, fetch in fetchers
+        ]
+
+    details = {}
+    for key, label, future in futures:
+        try:
+            details[key] = future.result()
+            print(f"  Found {len(details[key])} {label}")
+        except Exception as e:
+            print(f"  Error fetching {label}: {e}")
+            details[key] = []
+    return details
 
-        if not result:
-            break
 
-        things.extend(result)
+def download_assets(downloads, session, max_workers=DEFAULT_DOWNLOAD_WORKERS):
+    """
+    Download a list of (name, url, dest, options) assets concurrently.
 
-        if len(result) < per_page:
-            break
+    options holds extra keyword arguments for download_file(). At most
+    max_workers downloads are in flight at once. Failures are reported per
+    asset and do not stop the remaining downloads.
+    """
+    if not downloads:
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(download_file, url, dest, session, **options): name
+            for name, url, dest, options in downloads
+        }
+        try:
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"    Error downloading {futures[future]}: {e}")
+        except KeyboardInterrupt:
+            # Stop the running downloads rather than waiting for them to finish
+            _stop_event.set()
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def get_user_things(username, session, max_workers=DEFAULT_PAGE_WORKERS):
+    """
+    Get all published things by a user.
+
+    The endpoint doesn't report how many pages there are, so after the
+    first page the rest are fetched max_workers at a time until a short or
+    empty page marks the end.
+    """
+    things = []
+    page = 1
+    per_page = 30
+    batch_size = 1
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            futures = [
+                executor.submit(api_get, f"/users/{username}/things", session,
+                                {"page": p, "per_page": per_page})
+                for p in range(page, page + batch_size)
+            ]
 
-        page += 1
-        time.sleep(DEFAULT_THROTTLE_SECONDS)  # Throttle pagination requests
+            # Pages past the end are never read, so their errors are ignored
+            for future in futures:
+                result = future.result()
+                if result:
+                    things.extend(result)
+                if not result or len(result) < per_page:
+                    return things
 
-    return things
+            page += batch_size
+            batch_size = max_workers
 
 
 def create_readme(thing, files, images, derivatives, makes_count, comments_count, output_dir):
     """Create a README.md file with Thing metadata."""
     readme_path = output_dir / "README.md"
 
-    with open(readme_path, "w", encoding="utf-8") as f:
-        # Title
-        f.write(f"# {thing.get('name', 'Unknown Thing')}\n\n")
-
-        # Main image (if available)
-        if images:
-            first_image = images[0]
-            image_name = first_image.get('_safe_name', '')
-            if image_name:
-                f.write(f"![{thing.get('name', 'Thing')}](images/{image_name})\n\n")
-
-        # Metadata section
-        f.write("## Metadata\n\n")
-        f.write(f"- **Thing ID:** {thing.get('id')}\n")
-        f.write(f"- **URL:** {thing.get('public_url', 'N/A')}\n")
-
-        creator = thing.get('creator', {})
-        if creator:
-            creator_name = creator.get('name', creator.get('first_name', 'Unknown'))
-            creator_url = creator.get('public_url', '')
-            f.write(f"- **Creator:** [{creator_name}]({creator_url})\n")
-
-        f.write(f"- **Added:** {thing.get('added', 'N/A')}\n")
-        f.write(f"- **Modified:** {thing.get('modified', 'N/A')}\n")
-        f.write(f"- **License:** {thing.get('license', 'N/A')}\n")
-        f.write(f"- **Like Count:** {thing.get('like_count', 0)}\n")
-        f.write(f"- **Download Count:** {thing.get('download_count', 0)}\n")
-        f.write(f"- **View Count:** {thing.get('view_count', 0)}\n")
-        f.write(f"- **Collect Count:** {thing.get('collect_count', 0)}\n")
-        f.write(f"- **Comment Count:** {comments_count}\n")
-        f.write(f"- **Makes Count:** {makes_count}\n")
-        f.write(f"- **Remix Count:** {len(derivatives)}\n")
-
-        # Tags
-        tags = thing.get('tags', [])
-        if tags:
-            tag_names = [tag.get('name', '') for tag in tags if tag.get('name')]
-            if tag_names:
-                f.write(f"- **Tags:** {', '.join(tag_names)}\n")
-
-        f.write("\n")
-
-        # Description
-        f.write("## Description\n\n")
-        description = thing.get('description', 'No description available.')
-        # Convert HTML to markdown-ish format
-        description = re.sub(r'<br\s*/?>', '\n', description)
-        description = re.sub(r'</?p>', '\n', description)
-        description = re.sub(r'<[^>]+>', '', description)  # Remove remaining HTML tags
-        f.write(f"{description}\n\n")
-
-        # Instructions (if available)
-        instructions = thing.get('instructions', '')
-        if instructions:
-            f.write("## Instructions\n\n")
-            instructions = re.sub(r'<br\s*/?>', '\n', instructions)
-            instructions = re.sub(r'</?p>', '\n', instructions)
-            instructions = re.sub(r'<[^>]+>', '', instructions)
-            f.write(f"{instructions}\n\n")
-
-        # Ancestors section
-        ancestors = thing.get('ancestors', [])
-        if ancestors:
-            f.write("## Ancestors\n\n")
-            f.write("This thing is a remix of:\n\n")
-            for ancestor in ancestors:
-                name = ancestor.get('name', 'Unknown')
-                url = ancestor.get('public_url', '')
-                creator = ancestor.get('creator', {})
-                creator_name = creator.get('name', creator.get('first_name', 'Unknown')) if creator else 'Unknown'
-                f.write(f"- [{name}]({url}) by {creator_name}\n")
-            f.write("\n")
-
-        # Remixes section
-        if derivatives:
-            f.write("## Remixes\n\n")
-            f.write("Things remixed from this:\n\n")
-            for derivative in derivatives:
-                name = derivative.get('name', 'Unknown')
-                url = derivative.get('public_url', '')
-                creator = derivative.get('creator', {})
-                creator_name = creator.get('name', creator.get('first_name', 'Unknown')) if creator else 'Unknown'
-                f.write(f"- [{name}]({url}) by {creator_name}\n")
-            f.write("\n")
-
-        # Files section
-        f.write("## Files\n\n")
-        if files:
-            for file_info in files:
-                file_name = file_info.get('name', 'unknown')
-                file_size = file_info.get('size', 0)
-                # Convert to human readable size
-                if file_size > 1024 * 1024:
-                    size_str = f"{file_size / (1024*1024):.2f} MB"
-                elif file_size > 1024:
-                    size_str = f"{file_size / 1024:.2f} KB"
-                else:
-                    size_str = f"{file_size} bytes"
-                f.write(f"- [{file_name}](files/{file_name}) ({size_str})\n")
-        else:
-            f.write("No files available.\n")
-        f.write("\n")
-
-        # Images section
-        f.write("## Images\n\n")
-        if images:
-            for img in images:
-                safe_name = img.get('_safe_name', '')
-                if safe_name:
-                    img_name = img.get('name', 'image')
-                    f.write(f"![{img_name}](images/{safe_name})\n\n")
-        else:
-            f.write("No images available.\n")
+    parts = []
+
+    # Title
+    parts.append(f"# {thing.get('name', 'Unknown Thing')}\n\n")
+
+    # Main image (if available)
+    if images:
+        first_image = images[0]
+        image_name = first_image.get('_safe_name', '')
+        if image_name:
+            parts.append(f"![{thing.get('name', 'Thing')}](images/{image_name})\n\n")
 
+    # Metadata section
+    parts.append("## Metadata\n\n")
+    parts.append(f"- **Thing ID:** {thing.get('id')}\n")
+    parts.append(f"- **URL:** {thing.get('public_url', 'N/A')}\n")
+
+    creator = thing.get('creator', {})
+    if creator:
+        creator_name = creator.get('name', creator.get('first_name', 'Unknown'))
+        creator_url = creator.get('public_url', '')
+        parts.append(f"- **Creator:** [{creator_name}]({creator_url})\n")
+
+    parts.append(f"- **Added:** {thing.get('added', 'N/A')}\n")
+    parts.append(f"- **Modified:** {thing.get('modified', 'N/A')}\n")
+    parts.append(f"- **License:** {thing.get('license', 'N/A')}\n")
+    parts.append(f"- **Like Count:** {thing.get('like_count', 0)}\n")
+    parts.append(f"- **Download Count:** {thing.get('download_count', 0)}\n")
+    parts.append(f"- **View Count:** {thing.get('view_count', 0)}\n")
+    parts.append(f"- **Collect Count:** {thing.get('collect_count', 0)}\n")
+    parts.append(f"- **Comment Count:** {comments_count}\n")
+    parts.append(f"- **Makes Count:** {makes_count}\n")
+    parts.append(f"- **Remix Count:** {len(derivatives)}\n")
+
+    # Tags
+    tags = thing.get('tags', [])
+    if tags:
+        tag_names = [tag.get('name', '') for tag in tags if tag.get('name')]
+        if tag_names:
+            parts.append(f"- **Tags:** {', '.join(tag_names)}\n")
+
+    parts.append("\n")
+
+    # Description
+    parts.append("## Description\n\n")
+    description = thing.get('description', 'No description available.')
+    # Convert HTML to markdown-ish format
+    description = html_to_text(description)
+    parts.append(f"{description}\n\n")
+
+    # Instructions (if available)
+    instructions = thing.get('instructions', '')
+    if instructions:
+        parts.append("## Instructions\n\n")
+        instructions = html_to_text(instructions)
+        parts.append(f"{instructions}\n\n")
+
+    # Ancestors section
+    ancestors = thing.get('ancestors', [])
+    if ancestors:
+        parts.append("## Ancestors\n\n")
+        parts.append("This thing is a remix of:\n\n")
+        for ancestor in ancestors:
+            name = ancestor.get('name', 'Unknown')
+            url = ancestor.get('public_url', '')
+            creator = ancestor.get('creator', {})
+            creator_name = creator.get('name', creator.get('first_name', 'Unknown')) if creator else 'Unknown'
+            parts.append(f"- [{name}]({url}) by {creator_name}\n")
+        parts.append("\n")
+
+    # Remixes section
+    if derivatives:
+        parts.append("## Remixes\n\n")
+        parts.append("Things remixed from this:\n\n")
+        for derivative in derivatives:
+            name = derivative.get('name', 'Unknown')
+            url = derivative.get('public_url', '')
+            creator = derivative.get('creator', {})
+            creator_name = creator.get('name', creator.get('first_name', 'Unknown')) if creator else 'Unknown'
+            parts.append(f"- [{name}]({url}) by {creator_name}\n")
+        parts.append("\n")
+
+    # Files section
+    parts.append("## Files\n\n")
+    if files:
+        for file_info in files:
+            file_name = file_info.get('name', 'unknown')
+            file_size = file_info.get('size', 0)
+            # Convert to human readable size
+            if file_size > 1024 * 1024:
+                size_str = f"{file_size / (1024*1024):.2f} MB"
+            elif file_size > 1024:
+                size_str = f"{file_size / 1024:.2f} KB"
+            else:
+                size_str = f"{file_size} bytes"
+            parts.append(f"- [{file_name}](files/{file_name}) ({size_str})\n")
+    else:
+        parts.append("No files available.\n")
+    parts.append("\n")
+
+    # Images section
+    parts.append("## Images\n\n")
+    if images:
+        for img in images:
+            safe_name = img.get('_safe_name', '')
+            if safe_name:
+                img_name = img.get('name', 'image')
+                parts.append(f"![{img_name}](images/{safe_name})\n\n")
+    else:
+        parts.append("No images available.\n")
+
+    readme_path.write_text("".join(parts), encoding="utf-8")
     return readme_path
 
 
@@ -273,35 +811,101 @@ def create_comments_file(thing, comments, output_dir):
     """Create a COMMENTS.md file with all comments."""
     comments_path = output_dir / "COMMENTS.md"
 
-    with open(comments_path, "w", encoding="utf-8") as f:
-        f.write(f"# Comments for {thing.get('name', 'Unknown Thing')}\n\n")
-        f.write(f"**Thing URL:** {thing.get('public_url', 'N/A')}\n\n")
-        f.write(f"**Total Comments:** {len(comments)}\n\n")
-        f.write("---\n\n")
-
-        if comments:
-            for comment in comments:
-                user = comment.get('user', {})
-                user_name = user.get('name', user.get('first_name', 'Unknown'))
-                user_url = user.get('public_url', '')
-                added = comment.get('added', 'Unknown date')
-                body = comment.get('body', '')
-
-                # Clean up HTML in comment body
-                body = re.sub(r'<br\s*/?>', '\n', body)
-                body = re.sub(r'</?p>', '\n', body)
-                body = re.sub(r'<[^>]+>', '', body)
-
-                f.write(f"### [{user_name}]({user_url})\n")
-                f.write(f"*{added}*\n\n")
-                f.write(f"{body}\n\n")
-                f.write("---\n\n")
-        else:
-            f.write("No comments yet.\n")
+    parts = []
+    parts.append(f"# Comments for {thing.get('name', 'Unknown Thing')}\n\n")
+    parts.append(f"**Thing URL:** {thing.get('public_url', 'N/A')}\n\n")
+    parts.append(f"**Total Comments:** {len(comments)}\n\n")
+    parts.append("---\n\n")
+
+    if comments:
+        for comment in comments:
+            user = comment.get('user', {})
+            user_name = user.get('name', user.get('first_name', 'Unknown'))
+            user_url = user.get('public_url', '')
+            added = comment.get('added', 'Unknown date')
+            body = comment.get('body', '')
+
+            # Clean up HTML in comment body
+            body = html_to_text(body)
+
+            parts.append(f"### [{user_name}]({user_url})\n")
+            parts.append(f"*{added}*\n\n")
+            parts.append(f"{body}\n\n")
+            parts.append("---\n\n")
+    else:
+        parts.append("No comments yet.\n")
 
+    comments_path.write_text("".join(parts), encoding="utf-8")
     return comments_path
 
 
+# Map common Thingiverse licenses to URLs
+LICENSE_URLS = MappingProxyType({
+    'Creative Commons - Attribution': 'https://creativecommons.org/licenses/by/4.0/',
+    'Creative Commons - Attribution - Share Alike': 'https://creativecommons.org/licenses/by-sa/4.0/',
+    'Creative Commons - Attribution - No Derivatives': 'https://creativecommons.org/licenses/by-nd/4.0/',
+    'Creative Commons - Attribution - Non-Commercial': 'https://creativecommons.org/licenses/by-nc/4.0/',
+    'Creative Commons - Attribution - Non-Commercial - Share Alike': 'https://creativecommons.org/licenses/by-nc-sa/4.0/',
+    'Creative Commons - Attribution - Non-Commercial - No Derivatives': 'https://creativecommons.org/licenses/by-nc-nd/4.0/',
+    'Creative Commons - Public Domain Dedication': 'https://creativecommons.org/publicdomain/zero/1.0/',
+    'GNU - GPL': 'https://www.gnu.org/licenses/gpl-3.0.en.html',
+    'GNU - LGPL': 'https://www.gnu.org/licenses/lgpl-3.0.en.html',
+    'BSD License': 'https://opensource.org/licenses/BSD-3-Clause',
+})
+
+# Creative Commons license terms, each with the spellings that indicate it
+CC_LICENSE_TERMS = (
+    (('Attribution',),
+     "- **Attribution** — You must give appropriate credit, provide a link to the license, and indicate if changes were made.\n"),
+    (('Non-Commercial', 'NonCommercial'),
+     "- **Non-Commercial** — You may not use the material for commercial purposes.\n"),
+    (('Share Alike', 'ShareAlike'),
+     "- **Share Alike** — If you remix, transform, or build upon the material, you must distribute your contributions under the same license.\n"),
+    (('No Derivatives', 'NoDerivatives'),
+     "- **No Derivatives** — If you remix, transform, or build upon the material, you may not distribute the modified material.\n"),
+    (('Public Domain',),
+     "- **Public Domain** — The creator has waived all copyright and related rights. You can copy, modify, distribute and perform the work, even for commercial purposes, all without asking permission.\n"),
+)
+
+
+@lru_cache(maxsize=None)
+def license_summary(license_name):
+    """
+    Build the License Summary section for a license name.
+
+    Only a handful of distinct licenses exist, so each summary is worked
+    out once per run and reused for every Thing that shares it.
+    """
+    license_url = LICENSE_URLS.get(license_name, '')
+
+    if 'Creative Commons' in license_name:
+        parts = [
+            "## License Summary\n\n",
+            "This work is licensed under a Creative Commons license.\n\n",
+        ]
+        parts.extend(
+            term for spellings, term in CC_LICENSE_TERMS
+            if any(spelling in license_name for spelling in spellings)
+        )
+    elif 'GPL' in license_name:
+        parts = [
+            "## License Summary\n\n",
+            "This work is licensed under the GNU General Public License.\n\n",
+            "You are free to use, modify, and distribute this work, but any derivative works must also be released under the GPL.\n",
+        ]
+    elif 'BSD' in license_name:
+        parts = [
+            "## License Summary\n\n",
+            "This work is licensed under the BSD License.\n\n",
+            "You are free to use, modify, and distribute this work with minimal restrictions.\n",
+        ]
+    else:
+        return ''
+
+    parts.append(f"\nFor full license terms, see: {license_url}\n")
+    return ''.join(parts)
+
+
 def create_license_file(thing, output_dir):
     """Create a LICENSE.md file with license information."""
     license_path = output_dir / "LICENSE.md"
@@ -313,21 +917,7 @@ def create_license_file(thing, output_dir):
     creator_name = creator.get('name', creator.get('first_name', 'Unknown')) if creator else 'Unknown'
     creator_url = creator.get('public_url', '') if creator else ''
 
-    # Map common Thingiverse licenses to URLs
-    license_urls = {
-        'Creative Commons - Attribution': 'https://creativecommons.org/licenses/by/4.0/',
-        'Creative Commons - Attribution - Share Alike': 'https://creativecommons.org/licenses/by-sa/4.0/',
-        'Creative Commons - Attribution - No Derivatives': 'https://creativecommons.org/licenses/by-nd/4.0/',
-        'Creative Commons - Attribution - Non-Commercial': 'https://creativecommons.org/licenses/by-nc/4.0/',
-        'Creative Commons - Attribution - Non-Commercial - Share Alike': 'https://creativecommons.org/licenses/by-nc-sa/4.0/',
-        'Creative Commons - Attribution - Non-Commercial - No Derivatives': 'https://creativecommons.org/licenses/by-nc-nd/4.0/',
-        'Creative Commons - Public Domain Dedication': 'https://creativecommons.org/publicdomain/zero/1.0/',
-        'GNU - GPL': 'https://www.gnu.org/licenses/gpl-3.0.en.html',
-        'GNU - LGPL': 'https://www.gnu.org/licenses/lgpl-3.0.en.html',
-        'BSD License': 'https://opensource.org/licenses/BSD-3-Clause',
-    }
-
-    license_url = license_urls.get(license_name, '')
+    license_url = LICENSE_URLS.get(license_name, '')
 
     with open(license_path, "w", encoding="utf-8") as f:
         f.write("# License\n\n")
@@ -342,57 +932,132 @@ def create_license_file(thing, output_dir):
         f.write("---\n\n")
 
         # Add license summary based on type
-        if 'Creative Commons' in license_name:
-            f.write("## License Summary\n\n")
-            f.write("This work is licensed under a Creative Commons license.\n\n")
-
-            if 'Attribution' in license_name:
-                f.write("- **Attribution** — You must give appropriate credit, provide a link to the license, and indicate if changes were made.\n")
-            if 'Non-Commercial' in license_name or 'NonCommercial' in license_name:
-                f.write("- **Non-Commercial** — You may not use the material for commercial purposes.\n")
-            if 'Share Alike' in license_name or 'ShareAlike' in license_name:
-                f.write("- **Share Alike** — If you remix, transform, or build upon the material, you must distribute your contributions under the same license.\n")
-            if 'No Derivatives' in license_name or 'NoDerivatives' in license_name:
-                f.write("- **No Derivatives** — If you remix, transform, or build upon the material, you may not distribute the modified material.\n")
-            if 'Public Domain' in license_name:
-                f.write("- **Public Domain** — The creator has waived all copyright and related rights. You can copy, modify, distribute and perform the work, even for commercial purposes, all without asking permission.\n")
-
-            f.write(f"\nFor full license terms, see: {license_url}\n")
-        elif 'GPL' in license_name:
-            f.write("## License Summary\n\n")
-            f.write("This work is licensed under the GNU General Public License.\n\n")
-            f.write("You are free to use, modify, and distribute this work, but any derivative works must also be released under the GPL.\n")
-            f.write(f"\nFor full license terms, see: {license_url}\n")
-        elif 'BSD' in license_name:
-            f.write("## License Summary\n\n")
-            f.write("This work is licensed under the BSD License.\n\n")
-            f.write("You are free to use, modify, and distribute this work with minimal restrictions.\n")
-            f.write(f"\nFor full license terms, see: {license_url}\n")
+        f.write(license_summary(license_name))
 
     return license_path
 
 
+def scan_dir(path):
+    """
+    List a directory as {name: os.DirEntry}, or {} if it doesn't exist.
+
+    DirEntry caches file type and (on Windows) stat results from the
+    listing, so later checks avoid extra syscalls.
+    """
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        return {}
+
+
+def http_date(timestamp):
+    """Convert a Thingiverse ISO 8601 timestamp to an HTTP date, or None."""
+    if not timestamp:
+        return None
+    try:
+        parsed = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S%z")
+    except ValueError:
+        return None
+    return format_datetime(parsed.astimezone(timezone.utc), usegmt=True)
+
+
+def load_validators(output_dir, thing_id):
+    """
+    Load the cache validators saved with a previous download of a Thing.
+
+    Returns None unless both .cache.json and metadata.json exist and the
+    validators belong to thing_id.
+    """
+    entries = scan_dir(output_dir)
+    if 'metadata.json' not in entries or '.cache.json' not in entries:
+        return None
+    try:
+        with open(output_dir / ".cache.json", "r", encoding="utf-8") as f:
+            validators = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return None
+    if str(validators.get('id')) != str(thing_id):
+        return None
+    return validators
+
+
+def save_validators(output_dir, validators):
+    """Save a Thing's cache validators to .cache.json next to metadata.json."""
+    validators_path = output_dir / ".cache.json"
+    with open(validators_path, "w", encoding="utf-8") as f:
+        json.dump(validators, f, indent=2)
+    return validators_path
+
+
 def load_existing_metadata(output_dir):
     """Load existing metadata.json if it exists."""
     metadata_path = output_dir / "metadata.json"
-    if metadata_path.exists():
-        try:
-            with open(metadata_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return None
-    return None
+    try:
+        with open(metadata_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return None
 
 
-def download_thing(thing_id, token, output_base=None, force=False):
+def write_json(f, value, indent=b"\n", depth=2):
+    """
+    Write a value to a binary file as indented JSON with orjson.
+
+    Dicts and lists in the first depth levels are written item by item, so
+    only one item's encoded form (say, a single comment) is held in memory
+    at a time; deeper values are encoded whole. The layout is the same as
+    json.dump with indent=2.
+    """
+    inner = indent + b"  "
+    if depth and isinstance(value, dict) and value:
+        f.write(b"{")
+        for i, (key, item) in enumerate(value.items()):
+            f.write((b"," if i else b"") + inner + orjson.dumps(key) + b": ")
+            write_json(f, item, inner, depth - 1)
+        f.write(indent + b"}")
+    elif depth and isinstance(value, list) and value:
+        f.write(b"[")
+        for i, item in enumerate(value):
+            f.write((b"," if i else b"") + inner)
+            write_json(f, item, inner, depth - 1)
+        f.write(indent + b"]")
+    else:
+        # Encoded strings never contain raw newlines, so this only indents
+        encoded = orjson.dumps(value, default=str, option=orjson.OPT_INDENT_2)
+        f.write(encoded.replace(b"\n", indent))
+
+
+def save_metadata(metadata, output_dir):
+    """
+    Save raw API data to metadata.json.
+
+    Without orjson the standard encoder streams the document to the file.
+    With orjson write_json streams it one list item at a time. Both give the
+    same layout as encoding the whole dict with indent=2.
+    """
+    metadata_path = output_dir / "metadata.json"
+    if orjson is None:
+        with open(metadata_path, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2, default=str)
+        return metadata_path
+
+    with open(metadata_path, "wb") as f:
+        write_json(f, metadata)
+    return metadata_path
+
+
+def download_thing(thing_id, session, output_base=None, force=False, listed_name=None):
     """
     Download a complete Thing from Thingiverse.
 
     Args:
         thing_id: The Thingiverse Thing ID
-        token: API authentication token
+        session: Authenticated HTTP session from create_session()
         output_base: Base directory for output (default: current directory)
         force: Force re-download even if unchanged
+        listed_name: Thing name from a listing, used to find a previous
+            download and skip an unchanged Thing with a conditional request
 
     Returns:
         Path to the created directory
@@ -404,24 +1069,42 @@ def download_thing(thing_id, token, output_base=None, force=False):
 
     print(f"Fetching Thing {thing_id}...")
 
+    # If we know where a previous download lives, ask the API to skip
+    # sending the Thing when it hasn't changed
+    validators = None
+    if listed_name and not force:
+        output_dir = output_base / sanitize_filename(listed_name, for_directory=True)
+        validators = load_validators(output_dir, thing_id)
+
     # Get Thing details
-    thing = get_thing(thing_id, token)
+    thing, validators = get_thing_if_modified(thing_id, session, validators)
+    if thing is None:
+        print("  Thing not modified since last download")
+        print("  Skipping download. Use --force to re-download.")
+        return output_dir
+
     thing_name = thing.get('name', f'thing_{thing_id}')
     print(f"  Name: {thing_name}")
 
-    # Create output directory
+    # Create output directory, listing it once instead of probing each path
     safe_name = sanitize_filename(thing_name, for_directory=True)
     output_dir = output_base / safe_name
-    output_dir.mkdir(parents=True, exist_ok=True)
+    entries = scan_dir(output_dir)
+    if not entries:
+        output_dir.mkdir(parents=True, exist_ok=True)
 
     files_dir = output_dir / "files"
-    files_dir.mkdir(exist_ok=True)
+    if 'files' not in entries:
+        files_dir.mkdir(exist_ok=True)
 
     images_dir = output_dir / "images"
-    images_dir.mkdir(exist_ok=True)
+    if 'images' not in entries:
+        images_dir.mkdir(exist_ok=True)
 
     # Check for existing metadata and compare modification times
-    existing_metadata = load_existing_metadata(output_dir)
+    existing_metadata = None
+    if 'metadata.json' in entries:
+        existing_metadata = load_existing_metadata(output_dir)
     thing_modified = thing.get('modified')
 
     if existing_metadata and not force:
@@ -431,130 +1114,113 @@ def download_thing(thing_id, token, output_base=None, force=False):
         if existing_modified and thing_modified and existing_modified == thing_modified:
             print(f"  Thing unchanged since last download (modified: {thing_modified})")
             print("  Skipping download. Use --force to re-download.")
+            save_validators(output_dir, validators)
             return output_dir
 
-    # Get and download files
-    print("Fetching files list...")
-    try:
-        files = get_thing_files(thing_id, token)
-        print(f"  Found {len(files)} files")
-
-        for i, file_info in enumerate(files, 1):
-            file_name = file_info.get('name', f'file_{i}')
-            download_url = file_info.get('download_url') or file_info.get('public_url')
-
-            if download_url:
-                dest = files_dir / sanitize_filename(file_name)
-                # Skip if file already exists
-                if dest.exists() and not force:
+    # Fetch the remaining metadata lists concurrently
+    details = fetch_thing_details(thing_id, session)
+    files = details['files']
+    images = details['images']
+    derivatives = details['derivatives']
+    makes = details['makes']
+    comments = details['comments']
+
+    # Collect (name, url, dest, options) for every asset to download
+    downloads = []
+
+    # Snapshot what's already on disk instead of checking each asset separately
+    existing_files = scan_dir(files_dir) if 'files' in entries else {}
+    existing_images = scan_dir(images_dir) if 'images' in entries else {}
+
+    # Download files
+    if files:
+        print("Downloading files...")
+    for i, file_info in enumerate(files, 1):
+        file_name = file_info.get('name', f'file_{i}')
+        download_url = file_info.get('download_url') or file_info.get('public_url')
+
+        if download_url:
+            safe_name = sanitize_filename(file_name)
+            dest = files_dir / safe_name
+            # Skip if file already exists, unless its size no longer matches
+            # the API (the file was replaced upstream, so download it again)
+            if safe_name in existing_files and not force:
+                expected_size = file_info.get('size')
+                if not expected_size or existing_files[safe_name].stat().st_size == expected_size:
                     print(f"  Skipping (exists): {file_name}")
                     continue
-                print(f"  Downloading: {file_name}")
-                try:
-                    download_file(download_url, dest, token)
-                except Exception as e:
-                    print(f"    Error downloading {file_name}: {e}")
+                print(f"  Updating (size changed): {file_name}")
+            elif f"{safe_name}.part" in existing_files and not force:
+                print(f"  Resuming (incomplete): {file_name}")
             else:
-                print(f"  No download URL for: {file_name}")
-    except Exception as e:
-        print(f"  Error fetching files: {e}")
-        files = []
-
-    # Get and download images
-    print("Fetching images list...")
-    try:
-        images = get_thing_images(thing_id, token)
-        print(f"  Found {len(images)} images")
-
-        for i, img in enumerate(images, 1):
-            img_name = img.get('name', f'image_{i}')
-
-            # Try to get the largest available image
-            sizes = img.get('sizes', [])
-            download_url = None
-
-            # Prefer display, then preview, then thumb
-            for size_pref in ['display', 'preview', 'thumb']:
-                for size_info in sizes:
-                    if size_info.get('type') == size_pref and size_info.get('url'):
-                        download_url = size_info['url']
-                        break
-                if download_url:
+                print(f"  Downloading: {file_name}")
+            downloads.append((file_name, download_url, dest, {
+                "authenticated": True,
+                "resume": not force,
+                "size": file_info.get('size'),
+            }))
+        else:
+            print(f"  No download URL for: {file_name}")
+
+    # Download images
+    if images:
+        print("Downloading images...")
+    for i, img in enumerate(images, 1):
+        img_name = img.get('name', f'image_{i}')
+
+        # Try to get the largest available image
+        sizes = img.get('sizes', [])
+        download_url = None
+
+        # Prefer display, then preview, then thumb
+        for size_pref in ['display', 'preview', 'thumb']:
+            for size_info in sizes:
+                if size_info.get('type') == size_pref and size_info.get('url'):
+                    download_url = size_info['url']
                     break
-
-            # Fallback to direct URL
-            if not download_url:
-                download_url = img.get('url')
-
             if download_url:
-                # Sanitize filename and ensure it has an extension
-                safe_name = sanitize_filename(img_name, for_image=True)
-                # Get extension from URL or default to .jpg
-                url_path = urlparse(download_url).path
-                url_ext = os.path.splitext(url_path)[1].lower()
-                current_ext = os.path.splitext(safe_name)[1].lower()
-                # Only consider valid image extensions
-                valid_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg'}
-                if current_ext not in valid_extensions:
-                    safe_name += url_ext if url_ext in valid_extensions else '.jpg'
-                # Store sanitized name for README
-                img['_safe_name'] = safe_name
-
-                dest = images_dir / safe_name
-                # Skip if file already exists
-                if dest.exists() and not force:
-                    print(f"  Skipping (exists): {safe_name}")
-                    continue
-                print(f"  Downloading: {safe_name}")
-                try:
-                    download_file(download_url, dest)
-                except Exception as e:
-                    print(f"    Error downloading {safe_name}: {e}")
-            else:
-                print(f"  No download URL for: {img_name}")
-    except Exception as e:
-        print(f"  Error fetching images: {e}")
-        images = []
-
-    # Get derivatives (remixes)
-    print("Fetching remixes...")
-    try:
-        derivatives = get_thing_derivatives(thing_id, token)
-        print(f"  Found {len(derivatives)} remixes")
-    except Exception as e:
-        print(f"  Error fetching remixes: {e}")
-        derivatives = []
+                break
+
+        # Fallback to direct URL
+        if not download_url:
+            download_url = img.get('url')
+
+        if download_url:
+            # Sanitize filename and ensure it has an extension
+            safe_name = sanitize_filename(img_name, for_image=True)
+            # Get extension from URL or default to .jpg
+            url_path = urlparse(download_url).path
+            url_ext = os.path.splitext(url_path)[1].lower()
+            current_ext = os.path.splitext(safe_name)[1].lower()
+            # Only consider valid image extensions
+            valid_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg'}
+            if current_ext not in valid_extensions:
+                safe_name += url_ext if url_ext in valid_extensions else '.jpg'
+            # Store sanitized name for README
+            img['_safe_name'] = safe_name
+
+            dest = images_dir / safe_name
+            # Skip if file already exists
+            if safe_name in existing_images and not force:
+                print(f"  Skipping (exists): {safe_name}")
+                continue
+            print(f"  Downloading: {safe_name}")
+            downloads.append((safe_name, download_url, dest, {}))
+        else:
+            print(f"  No download URL for: {img_name}")
 
-    # Get makes
-    print("Fetching makes...")
-    try:
-        makes = get_thing_makes(thing_id, token)
-        print(f"  Found {len(makes)} makes")
-    except Exception as e:
-        print(f"  Error fetching makes: {e}")
-        makes = []
-
-    # Get comments
-    print("Fetching comments...")
-    try:
-        comments = get_thing_comments(thing_id, token)
-        print(f"  Found {len(comments)} comments")
-    except Exception as e:
-        print(f"  Error fetching comments: {e}")
-        comments = []
+    download_assets(downloads, session)
 
     # Save raw JSON metadata
     print("Saving metadata...")
-    metadata_path = output_dir / "metadata.json"
-    with open(metadata_path, "w", encoding="utf-8") as f:
-        json.dump({
-            "thing": thing,
-            "files": files,
-            "images": images,
-            "derivatives": derivatives,
-            "makes": makes,
-            "comments": comments
-        }, f, indent=2, default=str)
+    save_metadata({
+        "thing": thing,
+        "files": files,
+        "images": images,
+        "derivatives": derivatives,
+        "makes": makes,
+        "comments": comments
+    }, output_dir)
 
     # Create README
     print("Creating README.md...")
@@ -568,16 +1234,67 @@ def download_thing(thing_id, token, output_base=None, force=False):
     print("Creating LICENSE.md...")
     create_license_file(thing, output_dir)
 
+    # Saved last, so an interrupted download is never treated as unchanged
+    save_validators(output_dir, validators)
+
     print(f"\nDone! Thing downloaded to: {output_dir}")
     return output_dir
 
 
-def download_user_things(username, token, output_dir, throttle=DEFAULT_THROTTLE_SECONDS, force=False):
-    """Download all published things by a user."""
+def download_user_thing(index, total, thing, session, output_dir, throttle, force=False):
+    """
+    Download one Thing from a user's list, then wait for the throttle delay.
+
+    Returns the Thing's directory, or None if the download failed.
+    """
+    check_stopped()
+    thing_id = thing.get('id')
+    thing_name = thing.get('name', f'thing_{thing_id}')
+
+    print(f"\n[{index}/{total}] Downloading: {thing_name} (ID: {thing_id})")
+
+    result = None
+    try:
+        result = download_thing(thing_id, session, output_dir, force=force,
+                                listed_name=thing.get('name'))
+    except requests.exceptions.HTTPError as e:
+        print(f"  Error downloading thing {thing_id}: {e}")
+        if e.response is not None:
+            print(f"  Response: {e.response.text}")
+    except Exception as e:
+        print(f"  Error downloading thing {thing_id}: {e}")
+
+    # Throttle between downloads
+    if index < total:
+        print(f"  Waiting {throttle}s before next download...")
+        _stop_event.wait(throttle)
+
+    return result
+
+
+def download_user_thing_group(group, total, session, output_dir, throttle, force=False):
+    """
+    Download Things that share a directory one after another.
+
+    group is a list of (index, thing) pairs in listing order. Returns the
+    directories of the Things that were downloaded.
+    """
+    downloaded = []
+    for index, thing in group:
+        result = download_user_thing(index, total, thing, session, output_dir, throttle,
+                                     force=force)
+        if result is not None:
+            downloaded.append(result)
+    return downloaded
+
+
+def download_user_things(username, session, output_dir, throttle=DEFAULT_THROTTLE_SECONDS,
+                         force=False, workers=DEFAULT_THING_WORKERS):
+    """Download all published things by a user, several Things at a time."""
     print(f"Fetching things for user: {username}")
 
     try:
-        things = get_user_things(username, token)
+        things = get_user_things(username, session)
     except requests.exceptions.HTTPError as e:
         print(f"Error fetching user things: {e}")
         return []
@@ -586,34 +1303,51 @@ def download_user_things(username, token, output_dir, throttle=DEFAULT_THROTTLE_
         print(f"No things found for user: {username}")
         return []
 
+    # A Thing can be listed twice when pages shift while paging
+    unique_things = {}
+    for thing in things:
+        unique_things.setdefault(thing.get('id'), thing)
+    things = list(unique_things.values())
+
     print(f"Found {len(things)} things by {username}")
 
-    downloaded = []
+    # Things with the same name are saved to the same directory, so each
+    # such group runs in one worker, in listing order, never concurrently
+    groups = {}
     for i, thing in enumerate(things, 1):
-        thing_id = thing.get('id')
-        thing_name = thing.get('name', f'thing_{thing_id}')
-
-        print(f"\n[{i}/{len(things)}] Downloading: {thing_name} (ID: {thing_id})")
+        name = thing.get('name') or f"thing_{thing.get('id')}"
+        groups.setdefault(sanitize_filename(name, for_directory=True), []).append((i, thing))
 
+    downloaded = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(download_user_thing_group, group, len(things), session, output_dir,
+                            throttle, force=force)
+            for group in groups.values()
+        ]
         try:
-            result = download_thing(thing_id, token, output_dir, force=force)
-            downloaded.append(result)
-        except requests.exceptions.HTTPError as e:
-            print(f"  Error downloading thing {thing_id}: {e}")
-            if e.response is not None:
-                print(f"  Response: {e.response.text}")
-        except Exception as e:
-            print(f"  Error downloading thing {thing_id}: {e}")
-
-        # Throttle between downloads
-        if i < len(things):
-            print(f"  Waiting {throttle}s before next download...")
-            time.sleep(throttle)
+            for future in as_completed(futures):
+                downloaded.extend(future.result())
+        except KeyboardInterrupt:
+            # Don't start any more Things, and have running ones stop at their
+            # next check so the executor shuts down without a long wait
+            _stop_event.set()
+            for future in futures:
+                future.cancel()
+            raise
 
     print(f"\nCompleted: Downloaded {len(downloaded)} of {len(things)} things")
     return downloaded
 
 
+def positive_int(value):
+    """argparse type for options that need a count of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Download Things from Thingiverse",
@@ -625,6 +1359,7 @@ Examples:
   %(prog)s --thing 11190 --output ./downloads
   %(prog)s --thing 11190 --force              # Re-download even if unchanged
   %(prog)s --user tbuser --output ./downloads --throttle 2.0
+  %(prog)s --user tbuser --workers 1          # One Thing at a time
         """
     )
 
@@ -655,12 +1390,33 @@ Examples:
         help=f"Seconds to wait between downloads (default: {DEFAULT_THROTTLE_SECONDS})"
     )
 
+    parser.add_argument(
+        "--workers", "-w",
+        type=positive_int,
+        default=DEFAULT_THING_WORKERS,
+        metavar="N",
+        help=f"Number of Things to download in parallel with --user (default: {DEFAULT_THING_WORKERS})"
+    )
+
     parser.add_argument(
         "--force", "-f",
         action="store_true",
         help="Force re-download even if thing is unchanged"
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Directory for the API response cache (default: {DEFAULT_CACHE_DIR})"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write the API response cache"
+    )
+
     parser.add_argument(
         "--token",
         metavar="TOKEN",
@@ -680,11 +1436,19 @@ Examples:
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # Keep a connection alive for every download that can run at once
+    session = create_session(
+        token,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        pool_maxsize=max(POOL_MAXSIZE, args.workers * DEFAULT_DOWNLOAD_WORKERS + MULTIPART_PARTS),
+    )
+
     try:
         if args.thing:
-            download_thing(args.thing, token, output_dir, force=args.force)
+            download_thing(args.thing, session, output_dir, force=args.force)
         elif args.user:
-            download_user_things(args.user, token, output_dir, args.throttle, force=args.force)
+            download_user_things(args.user, session, output_dir, args.throttle,
+                                 force=args.force, workers=args.workers)
     except requests.exceptions.HTTPError as e:
         print(f"API Error: {e}")
         if e.response is not None:
@@ -696,6 +1460,8 @@ Examples:
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        session.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,318 @@
+import io
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+import archiveallthethings as aatt
+
+FILE_URL = f"{aatt.API_BASE}/files/1/download"
+
+
+def make_response(status_code=200, body=b"", headers=None, url="https://cdn.example.com/file"):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.raw = io.BytesIO(body)
+    response.url = url
+    return response
+
+
+class StubSession:
+    """Session that replays canned responses and records the requests made."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs.get("headers") or {}))
+        return self.responses.pop(0)
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limit(monkeypatch):
+    monkeypatch.setattr(aatt, "_rate_limit_resume_at", 0.0)
+    monkeypatch.setattr(aatt, "_rate_limit_recovering", False)
+
+
+def test_html_to_text_converts_breaks_and_paragraphs():
+    assert aatt.html_to_text("<p>Hello<br/>world <b>bold</b></p>") == "\nHello\nworld bold\n"
+
+
+def test_html_to_text_keeps_literal_less_than_before_break():
+    text = "Layer height < 0.2mm<br>Infill 20%"
+    assert aatt.html_to_text(text) == "Layer height < 0.2mm\nInfill 20%"
+
+
+def test_html_to_text_keeps_literal_less_than_before_paragraph():
+    assert aatt.html_to_text("x <3 <p>thanks</p>") == "x <3 \nthanks\n"
+
+
+def test_download_file_retries_rate_limited_api_download(tmp_path):
+    session = StubSession(
+        make_response(429, headers={"Retry-After": "0.1"}, url=FILE_URL),
+        make_response(200, b"solid"),
+    )
+    dest = tmp_path / "part.stl"
+
+    aatt.download_file(FILE_URL, dest, session, authenticated=True)
+
+    assert dest.read_bytes() == b"solid"
+    assert len(session.requests) == 2
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_metadata_matches_indented_json_dump(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(aatt, "orjson", None)
+    metadata = {
+        "thing": {"id": 1, "name": "Cube", "tags": [{"name": "box"}], "ancestors": []},
+        "files": [],
+        "images": [{"id": 2, "sizes": [{"type": "display", "url": "https://example.com/a"}]}],
+        "comments": [{"id": i, "body": "nice\nprint", "votes": None} for i in range(3)],
+        "extra": {},
+    }
+
+    aatt.save_metadata(metadata, tmp_path)
+
+    assert (tmp_path / "metadata.json").read_text() == json.dumps(metadata, indent=2)
+
+
+def test_download_user_things_runs_things_sharing_a_directory_in_order(tmp_path, monkeypatch):
+    things = [
+        {"id": 1, "name": "Test"},
+        {"id": 2, "name": "Other"},
+        {"id": 3, "name": "test!"},
+        {"id": 4, "name": "TEST"},
+    ]
+    lock = threading.Lock()
+    running = set()
+    started = []
+
+    def fake_download_thing(thing_id, session, output_base, force=False, listed_name=None):
+        directory = aatt.sanitize_filename(listed_name, for_directory=True)
+        with lock:
+            assert directory not in running
+            running.add(directory)
+            started.append(thing_id)
+        time.sleep(0.05)
+        with lock:
+            running.remove(directory)
+        return tmp_path / directory
+
+    monkeypatch.setattr(aatt, "get_user_things", lambda username, session: things)
+    monkeypatch.setattr(aatt, "download_thing", fake_download_thing)
+
+    downloaded = aatt.download_user_things("bob", None, tmp_path, throttle=0, workers=4)
+
+    assert len(downloaded) == 4
+    assert [thing_id for thing_id in started if thing_id != 2] == [1, 3, 4]
+
+
+def test_rate_limit_pause_ends_on_ctrl_c(monkeypatch):
+    monkeypatch.setattr(aatt, "_stop_event", threading.Event())
+    monkeypatch.setattr(aatt, "_rate_limit_resume_at", time.time() + aatt.RATE_LIMIT_MAX_WAIT)
+    threading.Timer(0.1, aatt._stop_event.set).start()
+
+    start = time.time()
+    with pytest.raises(KeyboardInterrupt):
+        with aatt.rate_limit_slot():
+            pass
+    assert time.time() - start < 5
+
+
+def resume_download(tmp_path, partial, *responses, size=None):
+    """Resume a download of a .part file holding partial; return (dest, session)."""
+    dest = tmp_path / "part.stl"
+    (tmp_path / "part.stl.part").write_bytes(partial)
+    session = StubSession(*responses)
+    aatt.download_file("https://cdn.example.com/file", dest, session, resume=True, size=size)
+    assert not (tmp_path / "part.stl.part").exists()
+    return dest, session
+
+
+def test_download_file_resumes_part_file_with_206(tmp_path):
+    dest, session = resume_download(
+        tmp_path, b"hello ",
+        make_response(206, b"world", {"Content-Range": "bytes 6-10/11"}),
+    )
+
+    assert dest.read_bytes() == b"hello world"
+    assert session.requests[0][2]["Range"] == "bytes=6-"
+
+
+def test_download_file_treats_matching_416_as_complete(tmp_path):
+    dest, session = resume_download(
+        tmp_path, b"hello world",
+        make_response(416, headers={"Content-Range": "bytes */11"}),
+    )
+
+    assert dest.read_bytes() == b"hello world"
+    assert len(session.requests) == 1
+
+
+def test_download_file_restarts_on_mismatched_content_range(tmp_path):
+    dest, session = resume_download(
+        tmp_path, b"hello ",
+        make_response(206, b"hello world", {"Content-Range": "bytes 0-10/11"}),
+        make_response(200, b"hello world"),
+    )
+
+    assert dest.read_bytes() == b"hello world"
+    assert "Range" not in session.requests[1][2]
+
+
+def test_download_file_replaces_part_file_when_range_is_ignored(tmp_path):
+    dest, session = resume_download(
+        tmp_path, b"hello ",
+        make_response(200, b"hello world"),
+    )
+
+    assert dest.read_bytes() == b"hello world"
+    assert len(session.requests) == 1
+
+
+def test_download_file_restarts_when_resumed_file_has_wrong_size(tmp_path):
+    dest, session = resume_download(
+        tmp_path, b"stale ",
+        make_response(206, b"world", {"Content-Range": "bytes 6-10/11"}),
+        make_response(200, b"hello, new world"),
+        size=16,
+    )
+
+    assert dest.read_bytes() == b"hello, new world"
+    assert "Range" not in session.requests[1][2]
+
+
+class StubTransport:
+    """Stands in for HTTPAdapter.send, recording the validators each request carries."""
+
+    def __init__(self, monkeypatch, *responses):
+        self.responses = list(responses)
+        self.validators = []
+        monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", self.send)
+
+    def send(self, request, stream=False, **kwargs):
+        self.validators.append((request.headers.get("If-None-Match"),
+                                request.headers.get("If-Modified-Since")))
+        return self.responses.pop(0)
+
+
+def api_get_request(headers=None):
+    return requests.Request("GET", f"{aatt.API_BASE}/things/1", headers=headers).prepare()
+
+
+def test_caching_adapter_answers_304_from_stored_body(tmp_path, monkeypatch):
+    transport = StubTransport(
+        monkeypatch,
+        make_response(200, b'{"id": 1}', {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+        make_response(304),
+    )
+    adapter = aatt.CachingHTTPAdapter(tmp_path)
+
+    adapter.send(api_get_request())
+    response = adapter.send(api_get_request())
+
+    assert transport.validators[1] == ('"v1"', "Mon, 01 Jan 2024 00:00:00 GMT")
+    assert response.status_code == 200
+    assert response.json() == {"id": 1}
+
+
+def test_caching_adapter_expires_and_prunes_old_entries(tmp_path, monkeypatch):
+    transport = StubTransport(
+        monkeypatch,
+        make_response(200, b'{"id": 1}', {"ETag": '"v1"'}),
+        make_response(200, b'{"id": 1}', {"ETag": '"v1"'}),
+    )
+    adapter = aatt.CachingHTTPAdapter(tmp_path, expire_after=60)
+    adapter.send(api_get_request())
+    (entry,) = tmp_path.iterdir()
+    stray = tmp_path / "leftover.tmp"
+    stray.write_text("")
+    old = time.time() - 120
+    os.utime(entry, (old, old))
+    os.utime(stray, (old, old))
+
+    adapter.send(api_get_request())
+    assert transport.validators[1] == (None, None)
+
+    os.utime(entry, (old, old))
+    aatt.CachingHTTPAdapter(tmp_path, expire_after=60)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_caching_adapter_passes_requests_with_own_validators_through(tmp_path, monkeypatch):
+    transport = StubTransport(
+        monkeypatch,
+        make_response(200, b'{"id": 1}', {"ETag": '"v1"'}),
+        make_response(304),
+    )
+    adapter = aatt.CachingHTTPAdapter(tmp_path)
+    adapter.send(api_get_request())
+
+    response = adapter.send(api_get_request({"If-None-Match": '"mine"'}))
+
+    assert transport.validators[1] == ('"mine"', None)
+    assert response.status_code == 304
+
+
+def test_seconds_until_accepts_delay_timestamp_and_http_date():
+    now = time.time()
+    http_date = format_datetime(datetime.fromtimestamp(now + 120, timezone.utc), usegmt=True)
+
+    assert aatt.seconds_until("30") == 30
+    assert 55 < aatt.seconds_until(str(int(now + 60))) <= 60
+    assert 115 < aatt.seconds_until(http_date) <= 120
+    assert aatt.seconds_until("soon") == 0
+    assert aatt.seconds_until("86400") == aatt.RATE_LIMIT_MAX_WAIT
+
+
+class ConcurrencySession:
+    """Session that answers the first few requests with 429 and tracks overlap."""
+
+    def __init__(self, rate_limited):
+        self.lock = threading.Lock()
+        self.rate_limited = rate_limited
+        self.recovered = False
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.max_in_flight_recovering = 0
+
+    def request(self, method, url, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            if not self.recovered:
+                self.max_in_flight_recovering = max(self.max_in_flight_recovering, self.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight -= 1
+            if self.rate_limited:
+                self.rate_limited -= 1
+                return make_response(429, headers={"Retry-After": "0.1"}, url=url)
+            self.recovered = True
+        return make_response(200, b"{}", url=url)
+
+
+def test_requests_go_out_one_at_a_time_after_a_429():
+    aatt.update_rate_limit(make_response(429, headers={"Retry-After": "0.1"}))
+    session = ConcurrencySession(rate_limited=2)
+
+    threads = [threading.Thread(target=aatt.api_get, args=("/things/1", session))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert session.max_in_flight_recovering == 1
+    assert session.max_in_flight > 1
+    assert not aatt._rate_limit_recovering